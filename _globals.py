@@ -5,6 +5,15 @@ Global variables and constants used in the data analysis and visualization.
 DATA_PATH = 'The_role_of_consciously_timed_movements_in_shaping_and_improving_auditory_timing_(All_Subject_Data).csv'
 """str: Path to the main dataset CSV file."""
 
+PLOTS_DIR = 'plots'
+"""str: Directory where generated figures are saved."""
+
+CACHE_DIR = '.cache'
+"""str: Directory where analysis results are cached between runs."""
+
+TRIALTYPE_COL = 'trialtype'
+"""str: Name of the column representing the trial type."""
+
 VARS_TO_PRINT = {
     'movdist': 'Movement Distance',
     'force': 'Force',
@@ -21,11 +30,9 @@ MOVEMENT_COLS = ['movdist', 'force', 'stoplatency']
 ERROR_COLS = ['error']
 """list: List of column names representing error measures."""
 
-NUMERIC_COLS = ['movdist', 'force', 'stoplatency', 'repduration', 'error', 'abserror']
-"""list: List of column names containing numeric data."""
+NUMERIC_COLS = [col for col in VARS_TO_PRINT if col != TRIALTYPE_COL]
+"""list: List of column names containing numeric data.  Derived from `VARS_TO_PRINT` so the column schema has a single source of truth."""
 OBJECT_COLS = []  # Currently empty, but included for potential future use.
 """list: List of column names containing categorical/object data."""
-TRIALTYPE_COL = 'trialtype'
-"""str: Name of the column representing the trial type."""
 REQUIRED_COLS = NUMERIC_COLS + OBJECT_COLS + [TRIALTYPE_COL]
 """list: List of all required columns in the dataset.  Used for data validation."""
\ No newline at end of file
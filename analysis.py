@@ -1,8 +1,26 @@
+import hashlib
+import os
+import pickle
+from collections import defaultdict
+
+import numpy as np
 import seaborn as sns
+import matplotlib
+matplotlib.use('Agg')  # Figures are saved to disk, no interactive backend needed
 import matplotlib.pyplot as plt
 from scipy import stats
+from scipy.special import betainc
 from data_preprocessing import *
 
+# The column layout is fixed at import time, so the index arithmetic for the
+# correlation block is resolved once here instead of per analyze_relationships call
+_MOV_IDX = [NUMERIC_COLS.index(col) for col in MOVEMENT_COLS]
+_ERR_IDX = [NUMERIC_COLS.index(col) for col in ERROR_COLS]
+_PAIR_INDICES = [(i, j, mov_var, err_var)
+                 for i, mov_var in enumerate(MOVEMENT_COLS)
+                 for j, err_var in enumerate(ERROR_COLS)]
+
+
 class Analysis:
     """
     A class for analyzing relationships between movement parameters and errors in preprocessed data.
@@ -17,12 +35,13 @@ class Analysis:
         TypeError: If the provided `data` is not an instance of the `Data` class.
         ValueError: If the cleaned DataFrame is empty.
     """
-    def __init__(self, data):
+    def __init__(self, data, plot=False):
         """
         Initializes the Analysis object.
 
         Args:
             data (Data): The preprocessed data.
+            plot (bool): If True, create and save the figures alongside the numeric results.
         """
         if not isinstance(data, Data):
             print("Only Data class is supported")
@@ -34,9 +53,47 @@ class Analysis:
             print("No data to analyze")
             return
 
-        self.relationships_results = self.analyze_relationships()
+        # Partition by trial type once via the precomputed integer codes; every
+        # consumer indexes into the cache instead of re-scanning the DataFrame
+        self._trial_types = list(self.data.trial_levels)
+        self._group_rows = {trial: np.flatnonzero(self.data.trial_codes == code)
+                            for code, trial in enumerate(self._trial_types)}
+        self._groups = {}
+        for trial, rows in self._group_rows.items():
+            group = self.df.iloc[rows]  # Fancy indexing already yields a new frame
+            group.reset_index(drop=True, inplace=True)
+            self._groups[trial] = group
+        # Sort the numeric matrix by trial code once so each trial's rows form a
+        # contiguous block, giving O(1) slice access with no mask or gather
+        order = np.argsort(self.data.trial_codes, kind='stable')
+        sorted_values = self.data.values[order]
+        boundaries = np.searchsorted(self.data.trial_codes[order],
+                                     np.arange(len(self._trial_types) + 1))
+        self._slices = {trial: sorted_values[boundaries[code]:boundaries[code + 1]]
+                        for code, trial in enumerate(self._trial_types)}
+
+        if plot:
+            os.makedirs(PLOTS_DIR, exist_ok=True)
+
+        # Memoize the correlation results on disk, keyed by a hash of the
+        # cleaned numeric data: reruns on unchanged data skip the whole pipeline
+        key = hashlib.blake2b(self.data.values.tobytes(), digest_size=16).hexdigest()
+        cache_path = os.path.join(CACHE_DIR, f'relationships_{key}.pkl')
+        if os.path.exists(cache_path):
+            with open(cache_path, 'rb') as f:
+                self.relationships_results = pickle.load(f)
+            if plot:
+                # Cached results skip the numeric pass, but the figures still
+                # have to be drawn when plotting is requested
+                self.create_all_plots()
+        else:
+            self.relationships_results = self.analyze_relationships(plot=plot)
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            with open(cache_path, 'wb') as f:
+                pickle.dump(self.relationships_results, f)
         self.significant_pairs = [pair for pair, res in self.relationships_results.items() if res['p_value'] < 0.05]
-        self.analyze_response_time_impact()
+        if plot:
+            self.analyze_response_time_impact()
 
     def __str__(self):
         return str(self.relationships_results)
@@ -53,10 +110,19 @@ class Analysis:
         """
         return col in self.df.columns
 
+    def create_all_plots(self):
+        """
+        Creates and saves the per-pair plots for every movement/error pair whose
+        columns are present in the DataFrame.
+        """
+        for _, _, mov_var, err_var in _PAIR_INDICES:
+            if self.check_col(mov_var) and self.check_col(err_var):
+                self.create_plots(mov_var, err_var)
+
     def create_plots(self, mov_var, err_var):
         """
-        Creates and displays plots to visualize the relationship between two variables,
-        separated by trial type.
+        Creates and saves plots (under `PLOTS_DIR`) to visualize the relationship between
+        two variables, separated by trial type.
 
         Args:
             mov_var (str): The name of the movement variable column.
@@ -71,9 +137,15 @@ class Analysis:
 
         fig, axes = plt.subplots(1, 2, figsize=(15, 3))
         sns.scatterplot(data=self.df, x=mov_var, y=err_var, hue=TRIALTYPE_COL, ax=axes[0])
-        for trial in self.df[TRIALTYPE_COL].unique():
-            trial_data = self.df[self.df[TRIALTYPE_COL] == trial]
-            sns.regplot(data=trial_data, x=mov_var, y=err_var, scatter=False, ax=axes[0])
+        for trial in self._trial_types:
+            # A least-squares line from np.polyfit skips seaborn's bootstrap CI
+            trial_data = self._groups[trial]
+            x = trial_data[mov_var].to_numpy()
+            if x.min() == x.max():
+                continue  # No line can be fit to a constant predictor
+            slope, intercept = np.polyfit(x, trial_data[err_var].to_numpy(), 1)
+            x_ends = np.array([x.min(), x.max()])
+            axes[0].plot(x_ends, slope * x_ends + intercept, label=trial)
         axes[0].set_xlabel(VARS_TO_PRINT[mov_var])
         axes[0].set_ylabel(VARS_TO_PRINT[err_var])
         axes[0].set_title(f'{VARS_TO_PRINT[mov_var]} vs {VARS_TO_PRINT[err_var]} by Trial Type')
@@ -83,19 +155,24 @@ class Analysis:
         axes[1].set_xlabel(VARS_TO_PRINT[TRIALTYPE_COL])
         axes[1].set_ylabel(VARS_TO_PRINT[err_var])
         axes[1].set_title(f'{VARS_TO_PRINT[err_var]} by Trial Type')
-        plt.show()
+        fig.savefig(os.path.join(PLOTS_DIR, f'{mov_var}_vs_{err_var}.png'))
+        plt.close(fig)
 
-        trial_types = self.df[TRIALTYPE_COL].unique()
+        trial_types = self._trial_types
         fig, axes = plt.subplots(1, len(trial_types), figsize=(15, 3), constrained_layout=True)
         fig.suptitle(f'{VARS_TO_PRINT[mov_var]} by Trial Type', y=1.05)
         if len(trial_types) == 1:
             axes = [axes]  # Handle the case of a single trial type
+        # Shared bin edges from the full column keep the subplots comparable and
+        # avoid re-deriving edges per trial inside sns.histplot
+        edges = np.histogram_bin_edges(self.df[mov_var].to_numpy(), bins='auto')
         for i, trial in enumerate(trial_types):
-            trial_data = self.df[self.df[TRIALTYPE_COL] == trial]
-            sns.histplot(data=trial_data, x=mov_var, ax=axes[i])
+            counts, _ = np.histogram(self._groups[trial][mov_var].to_numpy(), bins=edges)
+            axes[i].bar(edges[:-1], counts, width=np.diff(edges), align='edge')
             axes[i].set_title(f'{trial}')
             axes[i].set_ylabel(VARS_TO_PRINT[err_var] + ' Index')
-        plt.show()
+        fig.savefig(os.path.join(PLOTS_DIR, f'{mov_var}_by_trial_type.png'))
+        plt.close(fig)
         return True
 
     def get_correlation(self, trial_type, mov_var, err_var):
@@ -110,27 +187,55 @@ class Analysis:
         Returns:
             tuple: A tuple containing the Pearson correlation coefficient and the p-value.
         """
-        trial_data = self.df[self.df[TRIALTYPE_COL] == trial_type]
+        trial_data = self._groups[trial_type]
         return stats.pearsonr(trial_data[mov_var], trial_data[err_var])
 
-    def analyze_relationships(self):
+    def analyze_relationships(self, plot=False):
         """
         Analyzes the relationships between movement parameters and error variables across different trial types.
 
+        Args:
+            plot (bool): If True, also create and save the plots for each analyzed pair.
+
         Returns:
-            dict: A dictionary where keys are strings representing the combination of movement variable, error variable, and trial type (e.g., "amplitude_constant_A"), and values are dictionaries containing the 'correlation' and 'p_value'.
+            dict: A dictionary keyed by (movement variable, error variable, trial type) tuples, with values containing the 'correlation' and 'p_value'.
         """
         results = {}
 
-        for mov_var in MOVEMENT_COLS:
-            for err_var in ERROR_COLS:
-                if self.create_plots(mov_var, err_var): # Only calculate correlations if plots are created
-                    for trial_type in self.df[TRIALTYPE_COL].unique():
-                        correlation = self.get_correlation(trial_type, mov_var, err_var)
-                        results[f'{mov_var}_{err_var}_{trial_type}'] = {
-                            'correlation': correlation[0],
-                            'p_value': correlation[1]
-                        }
+        # Only calculate correlations for pairs whose columns are present;
+        # plotting is opt-in so the numeric results never wait on rendering
+        pairs = {(mov_var, err_var) for mov_var in MOVEMENT_COLS for err_var in ERROR_COLS
+                 if self.check_col(mov_var) and self.check_col(err_var)}
+        if not pairs:
+            return results
+        if plot:
+            self.create_all_plots()
+
+        # Pearson r of every (movement, error) pair for one trial type is a
+        # single matmul of the mean-centered, l2-normalized column blocks --
+        # one BLAS call instead of a pearsonr pass per (pair, trial) combination
+        for trial_type in self._trial_types:
+            sub = self._slices[trial_type]
+            n = sub.shape[0]
+            with np.errstate(divide='ignore', invalid='ignore'):
+                X = sub[:, _MOV_IDX] - sub[:, _MOV_IDX].mean(axis=0)
+                X /= np.linalg.norm(X, axis=0)
+                Y = sub[:, _ERR_IDX] - sub[:, _ERR_IDX].mean(axis=0)
+                Y /= np.linalg.norm(Y, axis=0)
+            # Keep float64 for the p-values so tail probabilities stay accurate;
+            # clip guards against |r| creeping past 1 from float32 rounding
+            r = np.clip((X.T @ Y).astype(np.float64), -1.0, 1.0)
+            # Two-sided p-values via the symmetric beta distribution of r under
+            # the null -- the same closed form scipy.stats.pearsonr evaluates,
+            # vectorized over all pairs and exact even at |r| == 1
+            ab = n / 2 - 1
+            p = 2 * betainc(ab, ab, 0.5 * (1 - np.abs(r)))
+            for i, j, mov_var, err_var in _PAIR_INDICES:
+                if (mov_var, err_var) in pairs:
+                    results[(mov_var, err_var, trial_type)] = {
+                        'correlation': r[i, j],
+                        'p_value': p[i, j]
+                    }
         return results
 
     def analyze_response_time_impact(self):
@@ -140,25 +245,50 @@ class Analysis:
         Returns:
             bool: True if the analysis and visualization were successful.
         """
-        for pair in self.significant_pairs:
-            mov_var, err_var, trial_type = pair.split('_')
-            trial_data = self.df[self.df[TRIALTYPE_COL] == trial_type]
-
-            plt.figure(figsize=(12, 8))
-            scatter = plt.scatter(
-                trial_data[mov_var],
-                trial_data[err_var],
-                c=trial_data['repduration'],  # Color by response duration
-                cmap='viridis',
-                s=50,
-                alpha=0.7,
-                edgecolor='k'
-            )
-            plt.colorbar(scatter, label='Response Duration')
-            plt.xlabel(VARS_TO_PRINT[mov_var])
-            plt.ylabel(VARS_TO_PRINT[err_var])
-            plt.title(f'{VARS_TO_PRINT[mov_var]} vs {VARS_TO_PRINT[err_var]} (colored by Response Duration)\nTrial Type: {trial_type}')
-            plt.grid(True, linestyle='--', alpha=0.6)
-            plt.tight_layout()
-            plt.show()
-        return True
\ No newline at end of file
+        col_idx = self.data.col_idx
+        # Group pairs by trial type so each trial's data is looked up once
+        by_trial = defaultdict(list)
+        for mov_var, err_var, trial_type in self.significant_pairs:
+            by_trial[trial_type].append((mov_var, err_var))
+
+        # One subplot grid (and one saved figure) per trial type, instead of a
+        # full figure setup and save per significant pair
+        for trial_type, trial_pairs in by_trial.items():
+            sub = self._slices[trial_type]
+            fig, axes = plt.subplots(1, len(trial_pairs),
+                                     figsize=(6 * len(trial_pairs), 6), constrained_layout=True)
+            fig.suptitle(f'Significant pairs colored by Response Duration - Trial Type: {trial_type}')
+            for ax, (mov_var, err_var) in zip(np.atleast_1d(axes), trial_pairs):
+                self._plot_response_time_pair(ax, sub, col_idx, mov_var, err_var)
+            fig.savefig(os.path.join(PLOTS_DIR, f'significant_pairs_{trial_type}_repduration.png'))
+            plt.close(fig)
+        return True
+
+    def _plot_response_time_pair(self, ax, sub, col_idx, mov_var, err_var):
+        """
+        Draws one response-duration-colored scatter for a significant pair onto an axis.
+
+        Args:
+            ax (matplotlib.axes.Axes): The axis to draw on.
+            sub (np.ndarray): The trial's contiguous numeric matrix slice.
+            col_idx (dict): Mapping of column name to index in `sub`.
+            mov_var (str): The name of the movement variable column.
+            err_var (str): The name of the error variable column.
+        """
+        # Pre-sliced NumPy columns and unstroked markers keep the draw a
+        # single batched path; rasterized avoids per-point vector output
+        scatter = ax.scatter(
+            sub[:, col_idx[mov_var]],
+            sub[:, col_idx[err_var]],
+            c=sub[:, col_idx['repduration']],  # Color by response duration
+            cmap='viridis',
+            s=50,
+            alpha=0.7,
+            edgecolors='none',
+            rasterized=True
+        )
+        ax.figure.colorbar(scatter, ax=ax, label='Response Duration')
+        ax.set_xlabel(VARS_TO_PRINT[mov_var])
+        ax.set_ylabel(VARS_TO_PRINT[err_var])
+        ax.set_title(f'{VARS_TO_PRINT[mov_var]} vs {VARS_TO_PRINT[err_var]}')
+        ax.grid(True, linestyle='--', alpha=0.6)
@@ -1,31 +1,42 @@
-from analysis import *
-
-def main(data_path):
-    """
-    Run full analysis process
-    """
-    try:
-        # Load data
-        data = Data(data_path)
-        # Analyze data
-        analysis = Analysis(data)
-        print(analysis)
-        return analysis.relationships_results
-
-    except FileNotFoundError:
-        print(f"File not found: {data_path}")
-        return
-    except pd.errors.EmptyDataError:
-        print("No data found in the CSV file.")
-        return
-    except pd.errors.ParserError:
-        print("Error parsing the CSV file. Please check the file format.")
-        return
-    except ValueError as ve:
-        print(f"ValueError occurred: {ve}")
-        return
-    except Exception as e:
-        print(f"An unexpected error occurred: {e}")
-        return
-
-main(DATA_PATH)
\ No newline at end of file
+import sys
+
+import pandas as pd
+
+from _globals import DATA_PATH
+from analysis import Analysis
+from data_preprocessing import Data
+
+def main(data_path, plot=False):
+    """
+    Run full analysis process
+
+    Args:
+        data_path (str): Path to the CSV file to analyze.
+        plot (bool): If True, also generate and save the figures.
+    """
+    try:
+        # Load data
+        data = Data(data_path)
+        # Analyze data
+        analysis = Analysis(data, plot=plot)
+        print(analysis)
+        return analysis.relationships_results
+
+    except FileNotFoundError:
+        print(f"File not found: {data_path}")
+        return
+    except pd.errors.EmptyDataError:
+        print("No data found in the CSV file.")
+        return
+    except pd.errors.ParserError:
+        print("Error parsing the CSV file. Please check the file format.")
+        return
+    except ValueError as ve:
+        print(f"ValueError occurred: {ve}")
+        return
+    except Exception as e:
+        print(f"An unexpected error occurred: {e}")
+        return
+
+if __name__ == '__main__':
+    main(DATA_PATH, plot='--plot' in sys.argv)